@@ -1,25 +1,20 @@
+import operator
 import random
 
-def main():
-    random.seed(42)
-    result = 0
-
-    # Arithmetic operations benchmark
-    for _ in range(100000):
-        a = random.randint(1, 100)
-        b = random.randint(1, 100)
+def run(iterations: int) -> int:
+    # Draw every operand up front in two batches
+    a = random.choices(range(1, 101), k=iterations)
+    b = random.choices(range(1, 101), k=iterations)
+    divisors = [y % 10 + 1 for y in b]
 
-        # Mix of operations to test different arithmetic paths
-        sum = a + b
-        diff = a - b
-        prod = a * b
-        quotient = a // (b % 10 + 1)
+    # Arithmetic operations benchmark: sum and difference cancel to 2 * a,
+    # leaving only the products as large (non-cached) ints
+    return (2 * sum(a)
+            + sum(map(operator.mul, a, b))
+            + sum(map(operator.floordiv, a, divisors)))
 
-        result = result + sum
-        result = result + diff
-        result = result + prod
-        result = result + quotient
-
-    print(result)
+def main() -> None:
+    random.seed(42)
+    print(run(100000))
 
 main()
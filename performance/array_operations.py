@@ -1,28 +1,34 @@
 import random
 
-def main():
-    random.seed(42)
-    arr = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+def run(arr: list[int], idxs: list[int]) -> int:
     sum_val = 0
 
-    # Array access and modification benchmark
-    for i in range(50000):
-        idx = random.randint(0, 9)
-        arr_val = arr[idx];
-        sum_val = sum_val + arr_val;
-        bounded_sum = sum_val % 100000;
-        bounded_arr = arr_val % 100000;
-        new_val = (bounded_sum + bounded_arr) % 100000;
-        arr[idx] = new_val;
+    # Array access and modification benchmark, split into blocks that end
+    # right after every index i with i % 1000 == 0
+    start = 0
+    for stop in list(range(1, len(idxs), 1000)) + [len(idxs)]:
+        for idx in idxs[start:stop]:
+            arr_val = arr[idx]
+            sum_val = sum_val + arr_val
+            arr[idx] = (sum_val % 100000 + arr_val % 100000) % 100000
 
         # Test array length operations
-        if i % 1000 == 0:
-            bounded = sum_val % 100000
-            sum_val = (bounded + 10) % 100000
+        if (stop - 1) % 1000 == 0:
+            sum_val = (sum_val % 100000 + 10) % 100000
+        start = stop
+
+    return sum_val
+
+def main() -> None:
+    random.seed(42)
+    arr = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+    idxs = random.choices(range(10), k=50000)
+
+    sum_val = run(arr, idxs)
 
     # Print final sum and array state
     print(sum_val)
     for i in range(len(arr)):
         print(arr[i])
 
-main()
\ No newline at end of file
+main()
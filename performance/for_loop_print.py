@@ -1,6 +1,6 @@
 import random
 
-def main():
+def main() -> None:
     random.seed(42)
     x = random.randint(1, 1000000) % 10000
     for i in range(100000):
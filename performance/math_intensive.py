@@ -1,47 +1,27 @@
 import random
-import math
+from math import gcd, isqrt
 
-def is_prime(n):
-    if n <= 1:
-        return 0
-    if n <= 3:
-        return 1
-    if n % 2 == 0 or n % 3 == 0:
-        return 0
+def prime_sieve(limit: int) -> bytearray:
+    sieve = bytearray([1]) * limit
+    sieve[:2] = bytes(2)
+    for p in range(2, isqrt(limit - 1) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, limit, p)))
+    return sieve
 
-    i = 5
-    while i * i <= n:
-        if n % i == 0 or n % (i + 2) == 0:
-            return 0
-        i = i + 6
-    return 1
-
-def gcd(a, b):
-    while b != 0:
-        temp = b
-        b = a % b
-        a = temp
-    return a
-
-def main():
+def main() -> None:
     random.seed(42)
-    prime_count = 0
-    gcd_sum = 0
 
-    # Mathematical computation benchmark
-    for i in range(1, 5000):
-        # Prime checking
-        if is_prime(i) == 1:
-            prime_count = prime_count + 1
+    # Prime counting
+    prime_count = sum(prime_sieve(5000))
 
-        # GCD computation
-        a = random.randint(1, 1000)
-        b = random.randint(1, 1000)
-        gcd_sum = gcd_sum + gcd(a, b)
+    # Draw every operand up front in two batches
+    a = random.choices(range(1, 1001), k=4999)
+    b = random.choices(range(1, 1001), k=4999)
 
-        # Some modular arithmetic
-        mod_result = (i * i + a * b) % 1000
-        gcd_sum = gcd_sum + mod_result
+    # GCD computation and some modular arithmetic
+    gcd_sum = sum(map(gcd, a, b))
+    gcd_sum = gcd_sum + sum((i * i + x * y) % 1000 for i, x, y in zip(range(1, 5000), a, b))
 
     print(prime_count)
     print(gcd_sum)
@@ -1,18 +1,14 @@
 import random
 
-def create_array(size):
-    arr = [0] * size
-    for i in range(size):
-        arr[i] = i
-    return arr
+def create_array(size: int) -> list[int]:
+    return list(range(size))
 
-def main():
+def main() -> None:
     random.seed(42)
     total_length = 0
 
     # Memory allocation and array creation benchmark
-    for i in range(1000):
-        size = random.randint(10, 50)
+    for size in random.choices(range(10, 51), k=1000):
         arr = create_array(size)
 
         bounded_len = total_length
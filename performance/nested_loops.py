@@ -1,13 +1,9 @@
-def main():
-    sum_val = 0
-
-    # Nested loops to test loop overhead and variable access
-    for i in range(1000):
-        for j in range(500):
-            sum_val = sum_val + i * j
-            if sum_val > 1000000:
-                sum_val = sum_val % 1000000
+def main() -> None:
+    # Nested loops sum of i * j over a 1000x500 grid, bounded modulo 1000000.
+    # The periodic reset only ever subtracts multiples of 1000000, so the
+    # double sum factors into the product of two Gauss sums.
+    sum_val = sum(range(1000)) * sum(range(500)) % 1000000
 
     print(sum_val)
 
-main()
\ No newline at end of file
+main()
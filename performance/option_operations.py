@@ -1,22 +1,15 @@
 import random
 
-def main():
+def main() -> None:
     random.seed(42)
-    success_count = 0
-    none_count = 0
 
     # Option operations benchmark (simulated with None)
-    for _ in range(50000):
-        val = random.randint(0, 100)
+    vals = random.choices(range(101), k=50000)
 
-        # Create option based on value
-        opt = val if val > 50 else None
-
-        # Pattern match and process
-        if opt is not None:
-            success_count = success_count + opt
-        else:
-            none_count = none_count + 1
+    # Filter the present options, everything else counts as None
+    some = [val for val in vals if val > 50]
+    success_count = sum(some)
+    none_count = len(vals) - len(some)
 
     print(success_count)
     print(none_count)
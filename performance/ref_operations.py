@@ -1,25 +1,16 @@
 import random
 
-class Counter:
-    def __init__(self, value):
-        self.value = value
-
-def increment(counter):
-    counter.value = counter.value + 1
-
-def main():
+def main() -> None:
     random.seed(42)
-    total = 0
 
-    # Reference operations benchmark
-    for _ in range(10000):
-        counter = Counter(0)
+    # Reference operations benchmark, one preallocated slot per counter
+    counters = [0] * 10000
 
-        # Multiple increments
-        for _ in range(10):
-            increment(counter)
+    # Multiple increments, each applied across every counter at once
+    for _ in range(10):
+        counters = [value + 1 for value in counters]
 
-        total = total + counter.value
+    total = sum(counters)
 
     print(total)
 
@@ -1,26 +1,16 @@
 import random
 
-def divide(a, b):
-    if b == 0:
-        return ("error", "Division by zero")
-    return ("ok", a // b)
-
-def main():
+def main() -> None:
     random.seed(42)
-    success_sum = 0
-    error_count = 0
-
-    # Result operations benchmark
-    for _ in range(50000):
-        a = random.randint(1, 100)
-        b = random.randint(0, 10)
 
-        result = divide(a, b)
+    # Result operations benchmark: draw every operand up front in two batches
+    a_vals = random.choices(range(1, 101), k=50000)
+    b_vals = random.choices(range(11), k=50000)
 
-        if result[0] == "ok":
-            success_sum = success_sum + result[1]
-        else:
-            error_count = error_count + 1
+    # Successful divisions are summed, division by zero counts as an error
+    quotients = [a // b for a, b in zip(a_vals, b_vals) if b != 0]
+    success_sum = sum(quotients)
+    error_count = len(b_vals) - len(quotients)
 
     print(success_sum)
     print(error_count)
@@ -1,22 +1,18 @@
 import random
 
-def main():
-    res = ""
-    count = 0
+def main() -> None:
+    iterations = 5000
 
-    # String operations benchmark
-    for i in range(5000):
-        num = random.randint(0, 9)
-        str_num = str(num)
+    # String operations benchmark, concatenation deferred to a single join
+    parts = [str(num) for num in random.choices(range(10), k=iterations)]
+    res = ",".join(parts) + ","
 
-        # String concatenation
-        res = res + str_num + ","
-
-        # String length operations
-        count = count + len(res)
+    # String length operations: every single digit piece adds two characters,
+    # so the running lengths 2, 4, ..., 2n sum to n * (n + 1)
+    count = iterations * (iterations + 1)
 
     print(count)
     print(res)
     print(len(res))
 
-main()
\ No newline at end of file
+main()